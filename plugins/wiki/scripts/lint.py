@@ -14,6 +14,7 @@ import argparse
 import json
 import sys
 import warnings
+from collections import Counter
 from pathlib import Path
 
 import _bootstrap  # noqa: F401 — side effect: adds plugin root to sys.path
@@ -112,9 +113,10 @@ def main() -> None:
         for manifest_path in sorted(chain_manifests):
             issues.extend(validate_chain(manifest_path, chain_skills_dirs))
 
-    # Count by severity
-    fail_count = sum(1 for i in issues if i["severity"] == "fail")
-    warn_count = sum(1 for i in issues if i["severity"] == "warn")
+    # Count by severity in one pass
+    severity_counts = Counter(i["severity"] for i in issues)
+    fail_count = severity_counts["fail"]
+    warn_count = severity_counts["warn"]
 
     # Output
     if args.json_output:
@@ -122,13 +124,17 @@ def main() -> None:
     elif issues:
         # Count unique files
         file_count = len({i["file"] for i in issues})
-        print(f"{fail_count} fail, {warn_count} warn across {file_count} files")
-        print()
-        print(f"{'file':<40} | {'sev':<4} | issue")
+        # Build every row first and write once, not one print() per issue
+        lines = [
+            f"{fail_count} fail, {warn_count} warn across {file_count} files",
+            "",
+            f"{'file':<40} | {'sev':<4} | issue",
+        ]
         for issue in issues:
             rel = _relative_path(issue["file"], root)
             sev = issue["severity"]
-            print(f"{rel:<40} | {sev:<4} | {issue['issue']}")
+            lines.append(f"{rel:<40} | {sev:<4} | {issue['issue']}")
+        print("\n".join(lines))
     else:
         print("All checks passed.")
 
@@ -115,6 +115,18 @@ def discover_areas(root: Path) -> List[Dict[str, str]]:
 
 # ── Render ───────────────────────────────────────────────────────
 
+# The section does not depend on its inputs, so it is assembled once.
+_WIKI_SECTION = "\n".join([
+    BEGIN_MARKER,
+    "## Context Navigation",
+    "",
+    "Directory-level routing lives in [RESOLVER.md](RESOLVER.md). "
+    "Consult it before filing or loading context.",
+    "Find files in registered directories via Glob on the directory's "
+    "naming pattern; read frontmatter `description` to identify the right file.",
+    END_MARKER,
+]) + "\n"
+
 
 def render_wiki_section(areas: List[Dict[str, str]]) -> str:
     """Render the managed section for AGENTS.md.
@@ -131,19 +143,7 @@ def render_wiki_section(areas: List[Dict[str, str]]) -> str:
         Markdown string wrapped in begin/end markers.
     """
     del areas  # reserved; not rendered
-    lines: List[str] = [BEGIN_MARKER]
-    lines.append("## Context Navigation")
-    lines.append("")
-    lines.append(
-        "Directory-level routing lives in [RESOLVER.md](RESOLVER.md). "
-        "Consult it before filing or loading context."
-    )
-    lines.append(
-        "Find files in registered directories via Glob on the directory's "
-        "naming pattern; read frontmatter `description` to identify the right file."
-    )
-    lines.append(END_MARKER)
-    return "\n".join(lines) + "\n"
+    return _WIKI_SECTION
 
 
 # ── Extract areas ────────────────────────────────────────────────
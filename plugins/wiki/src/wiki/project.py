@@ -7,8 +7,9 @@ files (AGENTS.md, CLAUDE.md).
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from wiki.document import parse_document
 
@@ -112,6 +113,9 @@ class Project:
         - CLAUDE.md missing
         - CLAUDE.md exists but doesn't reference ``@AGENTS.md``
 
+        Markers are ASCII, so files are searched as raw bytes without
+        decoding them.
+
         Returns:
             List of issue dicts. Empty if all checks pass.
         """
@@ -129,10 +133,13 @@ class Project:
             })
         else:
             try:
-                content = agents_path.read_text(encoding="utf-8")
+                content = agents_path.read_bytes()
             except OSError:
-                content = ""
-            if BEGIN_MARKER not in content and _LEGACY_BEGIN_MARKER not in content:
+                content = b""
+            if (
+                BEGIN_MARKER.encode() not in content
+                and _LEGACY_BEGIN_MARKER.encode() not in content
+            ):
                 issues.append({
                     "file": "AGENTS.md",
                     "issue": (
@@ -151,10 +158,10 @@ class Project:
             })
         else:
             try:
-                content = claude_path.read_text(encoding="utf-8")
+                content = claude_path.read_bytes()
             except OSError:
-                content = ""
-            if "@AGENTS.md" not in content:
+                content = b""
+            if b"@AGENTS.md" not in content:
                 issues.append({
                     "file": "CLAUDE.md",
                     "issue": (
@@ -211,10 +218,8 @@ def _conventionful_dirs(root: Path) -> List[str]:
         if not child.is_dir() or child.name in _AMBIENT_DIRS:
             continue
         count = 0
-        for md in child.rglob("*.md"):
-            if any(part in _AMBIENT_DIRS for part in md.parts):
-                continue
-            if _has_frontmatter(md):
+        for md in _iter_markdown(str(child)):
+            if _has_frontmatter(Path(md)):
                 count += 1
                 if count >= 2:
                     found.append(child.name)
@@ -222,6 +227,27 @@ def _conventionful_dirs(root: Path) -> List[str]:
     return found
 
 
+def _iter_markdown(top: str) -> Iterator[str]:
+    """Yield paths of ``.md`` files under top, pruning ambient directories.
+
+    Uses ``os.scandir`` so directory checks reuse the cached entry type
+    instead of stat-ing each path, and never descends into ambient dirs
+    or follows directory symlinks.
+    """
+    stack = [top]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _AMBIENT_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        yield entry.path
+        except OSError:
+            continue
+
+
 def _has_frontmatter(path: Path) -> bool:
     """Return True if the file's first non-empty line is a ``---`` delimiter."""
     try:
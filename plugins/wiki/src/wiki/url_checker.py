@@ -7,6 +7,7 @@ Used by validators to verify source URL reachability.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 from urllib.error import HTTPError, URLError
@@ -26,6 +27,7 @@ class UrlCheckResult:
 
 _HEADERS = {"User-Agent": "toolkit-url-checker/1.0"}
 _TIMEOUT = 10
+_MAX_WORKERS = 8
 
 
 def check_url(url: str) -> UrlCheckResult:
@@ -50,8 +52,8 @@ def check_url(url: str) -> UrlCheckResult:
     # Try HEAD first
     try:
         req = Request(url, method="HEAD", headers=_HEADERS)
-        resp = urlopen(req, timeout=_TIMEOUT)
-        status = resp.status
+        with urlopen(req, timeout=_TIMEOUT) as resp:
+            status = resp.status
     except HTTPError as exc:
         if exc.code == 405:
             # HEAD not allowed — fall back to GET
@@ -87,8 +89,8 @@ def _try_get(url: str) -> UrlCheckResult:
     """Fallback GET request when HEAD returns 405."""
     try:
         req = Request(url, headers=_HEADERS)
-        resp = urlopen(req, timeout=_TIMEOUT)
-        status = resp.status
+        with urlopen(req, timeout=_TIMEOUT) as resp:
+            status = resp.status
     except HTTPError as exc:
         return UrlCheckResult(
             url=url,
@@ -114,16 +116,18 @@ def check_urls(urls: list) -> list:
     """Check multiple URLs for reachability, deduplicating.
 
     Each unique URL is checked only once. Returns one UrlCheckResult
-    per unique URL. Empty input returns an empty list.
+    per unique URL, in first-seen order. Empty input returns an empty list.
+
+    Checks are network-bound, so unique URLs are checked concurrently on
+    a small thread pool (at most ``_MAX_WORKERS`` requests in flight).
     """
     if not urls:
         return []
 
-    seen: set = set()
-    results: list = []
-    for url in urls:
-        if url in seen:
-            continue
-        seen.add(url)
-        results.append(check_url(url))
-    return results
+    unique = list(dict.fromkeys(urls))
+
+    if len(unique) == 1:
+        return [check_url(unique[0])]
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(unique))) as pool:
+        return list(pool.map(check_url, unique))
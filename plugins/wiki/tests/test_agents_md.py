@@ -2,27 +2,36 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
+import pytest
+from wiki.agents_md import BEGIN_MARKER, END_MARKER
+
+# Markdown heading lines, matched in one pass over rendered output.
+_HEADING_RE = re.compile(r"^#+ .*$", re.MULTILINE)
+
 # ── discover_areas ─────────────────────────────────────────────
 
 
+def _write_tree(base: Path, files: dict[str, str]) -> None:
+    """Write ``{relpath: content}`` under base, creating parent dirs."""
+    for rel, content in files.items():
+        path = base / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
 class TestDiscoverAreas:
     def test_discovers_areas_from_disk(self, tmp_path: Path) -> None:
         from wiki.agents_md import discover_areas
 
-        # Create two area directories with docs
-        api_dir = tmp_path / "docs" / "context" / "api"
-        api_dir.mkdir(parents=True)
-        (api_dir / "endpoints.md").write_text(
-            "---\nname: Endpoints\ndescription: API endpoints\n---\n"
-        )
-
-        testing_dir = tmp_path / "docs" / "context" / "testing"
-        testing_dir.mkdir(parents=True)
-        (testing_dir / "unit.md").write_text(
-            "---\nname: Unit Tests\ndescription: Unit testing\n---\n"
-        )
+        _write_tree(tmp_path, {
+            "docs/context/api/endpoints.md":
+                "---\nname: Endpoints\ndescription: API endpoints\n---\n",
+            "docs/context/testing/unit.md":
+                "---\nname: Unit Tests\ndescription: Unit testing\n---\n",
+        })
 
         areas = discover_areas(tmp_path)
         assert len(areas) == 2
@@ -40,11 +49,10 @@ class TestDiscoverAreas:
     ) -> None:
         from wiki.agents_md import discover_areas
 
-        area_dir = tmp_path / "docs" / "context" / "my-area"
-        area_dir.mkdir(parents=True)
-        (area_dir / "topic.md").write_text(
-            "---\nname: Topic\ndescription: A topic\n---\n"
-        )
+        _write_tree(tmp_path, {
+            "docs/context/my-area/topic.md":
+                "---\nname: Topic\ndescription: A topic\n---\n",
+        })
 
         areas = discover_areas(tmp_path)
         assert len(areas) == 1
@@ -62,11 +70,10 @@ class TestDiscoverAreas:
         """discover_areas finds document dirs outside docs/."""
         from wiki.agents_md import discover_areas
 
-        project_dir = tmp_path / "project-x"
-        project_dir.mkdir()
-        (project_dir / "notes.md").write_text(
-            "---\nname: Notes\ndescription: Project notes\n---\n"
-        )
+        _write_tree(tmp_path, {
+            "project-x/notes.md":
+                "---\nname: Notes\ndescription: Project notes\n---\n",
+        })
 
         areas = discover_areas(tmp_path)
         assert len(areas) == 1
@@ -75,12 +82,10 @@ class TestDiscoverAreas:
     def test_sorted_alphabetically(self, tmp_path: Path) -> None:
         from wiki.agents_md import discover_areas
 
-        for name in ["zebra", "alpha", "middle"]:
-            d = tmp_path / "docs" / name
-            d.mkdir(parents=True)
-            (d / "topic.md").write_text(
-                f"---\nname: {name}\ndescription: {name}\n---\n"
-            )
+        _write_tree(tmp_path, {
+            f"docs/{name}/topic.md": f"---\nname: {name}\ndescription: {name}\n---\n"
+            for name in ["zebra", "alpha", "middle"]
+        })
 
         areas = discover_areas(tmp_path)
         paths = [a["path"] for a in areas]
@@ -90,20 +95,22 @@ class TestDiscoverAreas:
 # ── render_wiki_section ──────────────────────────────────────────
 
 
-class TestRenderNavigation:
-    def test_renders_resolver_pointer(self) -> None:
-        from wiki.agents_md import render_wiki_section
+@pytest.fixture(scope="module")
+def empty_section() -> str:
+    """Managed section rendered once for tests that only read it."""
+    from wiki.agents_md import render_wiki_section
 
-        result = render_wiki_section(areas=[])
-        assert "[RESOLVER.md](RESOLVER.md)" in result
-        assert "Consult it before filing or loading context." in result
+    return render_wiki_section(areas=[])
 
-    def test_renders_glob_discovery_convention(self) -> None:
-        from wiki.agents_md import render_wiki_section
 
-        result = render_wiki_section(areas=[])
-        assert "Glob" in result
-        assert "frontmatter" in result
+class TestRenderNavigation:
+    def test_renders_resolver_pointer(self, empty_section: str) -> None:
+        assert "[RESOLVER.md](RESOLVER.md)" in empty_section
+        assert "Consult it before filing or loading context." in empty_section
+
+    def test_renders_glob_discovery_convention(self, empty_section: str) -> None:
+        assert "Glob" in empty_section
+        assert "frontmatter" in empty_section
 
     def test_does_not_render_areas_table_with_or_without_areas(self) -> None:
         from wiki.agents_md import render_wiki_section
@@ -131,20 +138,15 @@ class TestRenderNavigation:
 
 
 class TestRenderNavigationHeader:
-    def test_renders_navigation_header(self) -> None:
-        from wiki.agents_md import render_wiki_section
-
-        result = render_wiki_section(areas=[])
-        assert "## Context Navigation" in result
+    def test_renders_navigation_header(self, empty_section: str) -> None:
+        headings = _HEADING_RE.findall(empty_section)
+        assert headings == ["## Context Navigation"]
 
 
 class TestRenderMarkers:
-    def test_output_wrapped_in_markers(self) -> None:
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, render_wiki_section
-
-        result = render_wiki_section(areas=[])
-        assert result.startswith(BEGIN_MARKER)
-        assert result.rstrip().endswith(END_MARKER)
+    def test_output_wrapped_in_markers(self, empty_section: str) -> None:
+        assert empty_section.startswith(BEGIN_MARKER)
+        assert empty_section.rstrip().endswith(END_MARKER)
 
 
 # ── legacy-marker migration ────────────────────────────────────
@@ -187,51 +189,51 @@ class TestMigrateLegacyMarkers:
 # ── update_agents_md ────────────────────────────────────────────
 
 
-class TestUpdateReplaceExisting:
-    def test_replaces_existing_section(self) -> None:
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, update_agents_md
-
-        content = (
-            "# AGENTS.md\n\n"
-            f"{BEGIN_MARKER}\nold content\n{END_MARKER}\n\n"
-            "## Other Section\n"
-        )
-        areas = [{"name": "API", "path": "docs/context/api"}]
-        result = update_agents_md(content, areas)
-        assert "old content" not in result
-        assert "[RESOLVER.md](RESOLVER.md)" in result
-        assert BEGIN_MARKER in result
-        assert END_MARKER in result
-
-
-class TestUpdateAppendWhenNoMarkers:
-    def test_appends_when_no_markers(self) -> None:
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, update_agents_md
+class TestUpdateAgentsMd:
+    @pytest.mark.parametrize(
+        "content,present,absent",
+        [
+            pytest.param(
+                "# AGENTS.md\n\n"
+                f"{BEGIN_MARKER}\nold content\n{END_MARKER}\n\n"
+                "## Other Section\n",
+                ["[RESOLVER.md](RESOLVER.md)", "## Other Section"],
+                ["old content"],
+                id="replaces-existing-section",
+            ),
+            pytest.param(
+                "# AGENTS.md\n\nSome existing content.\n",
+                ["Some existing content."],
+                [],
+                id="appends-when-no-markers",
+            ),
+            pytest.param(
+                "# AGENTS.md\n\n"
+                "Before section.\n\n"
+                f"{BEGIN_MARKER}\nold\n{END_MARKER}\n\n"
+                "After section.\n",
+                ["Before section.", "After section."],
+                ["old"],
+                id="preserves-content-outside-markers",
+            ),
+        ],
+    )
+    def test_update(
+        self, content: str, present: list[str], absent: list[str]
+    ) -> None:
+        from wiki.agents_md import update_agents_md
 
-        content = "# AGENTS.md\n\nSome existing content.\n"
         areas = [{"name": "API", "path": "docs/context/api"}]
         result = update_agents_md(content, areas)
         assert result.startswith("# AGENTS.md")
-        assert "Some existing content." in result
         assert BEGIN_MARKER in result
         assert END_MARKER in result
-
-
-class TestUpdatePreservesOutsideContent:
-    def test_preserves_content_outside_markers(self) -> None:
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, update_agents_md
-
-        content = (
-            "# AGENTS.md\n\n"
-            "Before section.\n\n"
-            f"{BEGIN_MARKER}\nold\n{END_MARKER}\n\n"
-            "After section.\n"
-        )
-        result = update_agents_md(content, areas=[])
-        assert "# AGENTS.md" in result
-        assert "Before section." in result
-        assert "After section." in result
-        assert "old" not in result
+        for text in present:
+            assert text in result
+        for text in absent:
+            assert text not in result
+        # Re-running on the updated file is a no-op
+        assert update_agents_md(result, areas) == result
 
 
 class TestUpdateAreasNotRendered:
@@ -255,22 +257,24 @@ class TestUpdateAreasNotRendered:
 
 # ── extract_areas ───────────────────────────────────────────────
 
+# Managed section in the legacy layout that still carried an Areas table.
+_AREAS_TABLE_SECTION = (
+    f"{BEGIN_MARKER}\n"
+    "### Areas\n"
+    "| Area | Path |\n"
+    "|------|------|\n"
+    "| How LLM agents decompose tasks into steps | docs/context/planning |\n"
+    "| API endpoint reference | docs/context/api |\n"
+    f"{END_MARKER}\n"
+)
+
 
 class TestExtractAreas:
     def test_preserves_human_descriptions(self) -> None:
         """Human-written descriptions (col1 != col2) are preserved as-is."""
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, extract_areas
+        from wiki.agents_md import extract_areas
 
-        content = (
-            f"{BEGIN_MARKER}\n"
-            "### Areas\n"
-            "| Area | Path |\n"
-            "|------|------|\n"
-            "| How LLM agents decompose tasks into steps | docs/context/planning |\n"
-            "| API endpoint reference | docs/context/api |\n"
-            f"{END_MARKER}\n"
-        )
-        result = extract_areas(content)
+        result = extract_areas(_AREAS_TABLE_SECTION)
         assert result == [
             {
                 "name": "How LLM agents decompose tasks into steps",
@@ -297,17 +301,9 @@ class TestUpdateAgentsMdAreasNone:
     def test_areas_table_in_existing_content_is_removed_on_update(self) -> None:
         """A pre-existing Areas table inside the managed region is dropped on
         re-render — directory-level routing now lives in RESOLVER.md."""
-        from wiki.agents_md import BEGIN_MARKER, END_MARKER, update_agents_md
+        from wiki.agents_md import update_agents_md
 
-        content = (
-            "# AGENTS.md\n\n"
-            f"{BEGIN_MARKER}\n"
-            "### Areas\n"
-            "| Area | Path |\n"
-            "|------|------|\n"
-            "| How LLM agents decompose tasks | docs/context/planning |\n"
-            f"{END_MARKER}\n"
-        )
+        content = "# AGENTS.md\n\n" + _AREAS_TABLE_SECTION
         result = update_agents_md(content)  # areas=None by default
         assert "### Areas" not in result
         assert "[RESOLVER.md](RESOLVER.md)" in result
@@ -321,15 +317,6 @@ class TestUpdateAgentsMdAreasNone:
         result = update_agents_md(content)
         assert "### Areas" not in result
 
-    def test_explicit_areas_still_no_table_rendered(self) -> None:
-        """Passing areas= is accepted for API compatibility but no table is rendered."""
-        from wiki.agents_md import update_agents_md
-
-        areas = [{"name": "Backend", "path": "docs/context/backend"}]
-        result = update_agents_md("# AGENTS.md\n", areas=areas)
-        assert "### Areas" not in result
-        assert "| Backend | docs/context/backend |" not in result
-
 
 # ── has_working_agreements ─────────────────────────────────────
 
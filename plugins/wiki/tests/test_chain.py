@@ -9,6 +9,18 @@ import pytest  # noqa: F401
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
+# Keys every parsed chain step dict carries.
+_STEP_KEYS = frozenset({"step", "skill", "input_contract", "output_contract", "gate"})
+
+# Static heading and table header shared by every generated manifest.
+_STEPS_TABLE_HEAD = (
+    "## Steps\n"
+    "\n"
+    "| Step | Skill | Input Contract | Output Contract | Gate |\n"
+    "|------|-------|----------------|-----------------|------|\n"
+)
+
+
 def _chain_md(
     name: str = "Test Chain",
     description: str = "A test chain",
@@ -46,25 +58,13 @@ def _chain_md(
         "",
     ])
 
-    table_header = "| Step | Skill | Input Contract | Output Contract | Gate |"
-    table_sep = "|------|-------|----------------|-----------------|------|"
-    rows = []
-    for s in steps:
-        rows.append(
-            f"| {s['step']} | {s['skill']} | {s['input_contract']}"
-            f" | {s['output_contract']} | {s['gate']} |"
-        )
-
-    body = "\n".join([
-        "## Steps",
-        "",
-        table_header,
-        table_sep,
-        *rows,
-        "",
-    ])
+    rows = "".join(
+        f"| {s['step']} | {s['skill']} | {s['input_contract']}"
+        f" | {s['output_contract']} | {s['gate']} |\n"
+        for s in steps
+    )
 
-    return fm + body
+    return fm + _STEPS_TABLE_HEAD + rows
 
 
 # ── TestParseChain ────────────────────────────────────────────────────
@@ -95,8 +95,7 @@ class TestParseChain:
 
         assert len(doc.steps) == 2
         step = doc.steps[0]
-        expected_keys = {"step", "skill", "input_contract", "output_contract", "gate"}
-        assert set(step.keys()) == expected_keys
+        assert step.keys() == _STEP_KEYS
         assert step["step"] == "1"
         assert step["skill"] == "research"
         assert step["input_contract"] == "user question"
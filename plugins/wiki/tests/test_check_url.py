@@ -1,20 +1,32 @@
 """Tests for scripts/check_url.py."""
 from __future__ import annotations
 
-import subprocess
 import sys
-from pathlib import Path
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest.mock import patch
 
-SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+def _run_check_url(*args: str) -> tuple[str, str, int]:
+    """Run check_url.main() in-process, returning (stdout, stderr, exitcode)."""
+    from scripts.check_url import main
+
+    captured_stdout = StringIO()
+    captured_stderr = StringIO()
+    exit_code = 0
+
+    with patch.object(sys, "argv", ["check_url.py", *args]):
+        with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
+            try:
+                main()
+            except SystemExit as exc:
+                exit_code = exc.code if exc.code is not None else 0
+
+    return captured_stdout.getvalue(), captured_stderr.getvalue(), exit_code
 
 
 class TestCheckUrlHelp:
-    def test_no_args_shows_usage(self, tmp_path: Path) -> None:
-        result = subprocess.run(
-            [sys.executable, str(SCRIPTS_DIR / "check_url.py")],
-            capture_output=True,
-            text=True,
-            cwd=str(tmp_path),
-        )
-        assert result.returncode != 0
-        assert "usage" in result.stderr.lower()
+    def test_no_args_shows_usage(self) -> None:
+        _, stderr, code = _run_check_url()
+        assert code != 0
+        assert "usage" in stderr.lower()
@@ -7,11 +7,31 @@ from wiki.document import parse_frontmatter
 
 
 class TestDelimiters:
-    def test_valid_frontmatter_returns_dict_and_body(self) -> None:
-        text = "---\nname: Test\ndescription: A test\n---\nBody content.\n"
+    @pytest.mark.parametrize(
+        "text,expected_fm,expected_body",
+        [
+            pytest.param(
+                "---\nname: Test\ndescription: A test\n---\nBody content.\n",
+                {"name": "Test", "description": "A test"},
+                "Body content.\n",
+                id="basic",
+            ),
+            pytest.param("---\n---\nBody.\n", {}, "Body.\n", id="empty"),
+            pytest.param(
+                "---\nname: Test\n---", {"name": "Test"}, "", id="eof_no_body"
+            ),
+            pytest.param(
+                "---\nname: Test\n---\n", {"name": "Test"}, "",
+                id="trailing_newline",
+            ),
+        ],
+    )
+    def test_parses_frontmatter_and_body(
+        self, text: str, expected_fm: dict, expected_body: str
+    ) -> None:
         fm, body = parse_frontmatter(text)
-        assert fm == {"name": "Test", "description": "A test"}
-        assert body == "Body content.\n"
+        assert fm == expected_fm
+        assert body == expected_body
 
     def test_no_opening_delimiter_raises(self) -> None:
         with pytest.raises(ValueError, match="frontmatter"):
@@ -21,70 +41,71 @@ class TestDelimiters:
         with pytest.raises(ValueError, match="closing"):
             parse_frontmatter("---\nname: Test\n")
 
-    def test_empty_frontmatter_returns_empty_dict(self) -> None:
-        fm, body = parse_frontmatter("---\n---\nBody.\n")
-        assert fm == {}
-        assert body == "Body.\n"
-
-    def test_frontmatter_at_end_of_file_no_body(self) -> None:
-        fm, body = parse_frontmatter("---\nname: Test\n---")
-        assert fm == {"name": "Test"}
-        assert body == ""
-
-    def test_frontmatter_with_trailing_newline_only(self) -> None:
-        fm, body = parse_frontmatter("---\nname: Test\n---\n")
-        assert fm == {"name": "Test"}
-        assert body == ""
-
 
 class TestScalarValues:
-    def test_key_value_pair(self) -> None:
-        fm, _ = parse_frontmatter("---\nname: Hello World\n---\n")
-        assert fm["name"] == "Hello World"
-
-    def test_key_with_no_value_is_none(self) -> None:
-        fm, _ = parse_frontmatter("---\nname: Test\ntype:\n---\n")
-        assert fm["type"] is None
-
-    def test_no_type_coercion_numbers_stay_strings(self) -> None:
-        fm, _ = parse_frontmatter("---\nname: 42\ndescription: 100\n---\n")
-        assert fm["name"] == "42"
-        assert fm["description"] == "100"
-
-    def test_no_type_coercion_booleans_stay_strings(self) -> None:
-        fm, _ = parse_frontmatter("---\nname: true\ndescription: false\n---\n")
-        assert fm["name"] == "true"
-        assert fm["description"] == "false"
-
-    def test_value_with_colon_in_it(self) -> None:
-        fm, _ = parse_frontmatter("---\nname: http://example.com\n---\n")
-        assert fm["name"] == "http://example.com"
-
-    def test_value_with_leading_trailing_spaces_stripped(self) -> None:
-        fm, _ = parse_frontmatter("---\nname:   Hello   \n---\n")
-        assert fm["name"] == "Hello"
-
-
-class TestListValues:
-    def test_simple_list(self) -> None:
-        text = "---\nsources:\n  - https://a.com\n  - https://b.com\n---\n"
-        fm, _ = parse_frontmatter(text)
-        assert fm["sources"] == ["https://a.com", "https://b.com"]
-
-    def test_list_items_without_indent(self) -> None:
-        text = "---\nsources:\n- https://a.com\n- https://b.com\n---\n"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("---\nname: Hello World\n---\n", {"name": "Hello World"}),
+            ("---\nname: Test\ntype:\n---\n", {"name": "Test", "type": None}),
+            # No type coercion: numbers and booleans stay strings
+            (
+                "---\nname: 42\ndescription: 100\n---\n",
+                {"name": "42", "description": "100"},
+            ),
+            (
+                "---\nname: true\ndescription: false\n---\n",
+                {"name": "true", "description": "false"},
+            ),
+            ("---\nname: http://example.com\n---\n", {"name": "http://example.com"}),
+            ("---\nname:   Hello   \n---\n", {"name": "Hello"}),
+        ],
+        ids=[
+            "key_value_pair",
+            "key_with_no_value_is_none",
+            "numbers_stay_strings",
+            "booleans_stay_strings",
+            "value_with_colon",
+            "surrounding_spaces_stripped",
+        ],
+    )
+    def test_scalar_value(self, text: str, expected: dict) -> None:
         fm, _ = parse_frontmatter(text)
-        assert fm["sources"] == ["https://a.com", "https://b.com"]
+        assert fm == expected
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            ("sources", "  - https://a.com\n  - https://b.com\n",
+             ["https://a.com", "https://b.com"]),
+            id="simple",
+        ),
+        pytest.param(
+            ("sources", "- https://a.com\n- https://b.com\n",
+             ["https://a.com", "https://b.com"]),
+            id="without-indent",
+        ),
+        pytest.param(
+            ("sources", "  -   https://a.com  \n", ["https://a.com"]),
+            id="values-stripped",
+        ),
+        pytest.param(
+            ("related", "  - file1.md\n  - file2.md\n", ["file1.md", "file2.md"]),
+            id="key-with-no-value",
+        ),
+    ]
+)
+def list_case(request: pytest.FixtureRequest) -> tuple[str, str, list[str]]:
+    """(key, indented item lines, expected list) for a block-list value."""
+    return request.param
 
-    def test_list_item_values_stripped(self) -> None:
-        text = "---\nsources:\n  -   https://a.com  \n---\n"
-        fm, _ = parse_frontmatter(text)
-        assert fm["sources"] == ["https://a.com"]
 
-    def test_key_with_no_value_followed_by_list(self) -> None:
-        text = "---\nrelated:\n  - file1.md\n  - file2.md\n---\n"
-        fm, _ = parse_frontmatter(text)
-        assert fm["related"] == ["file1.md", "file2.md"]
+class TestListValues:
+    def test_block_list(self, list_case: tuple[str, str, list[str]]) -> None:
+        key, items, expected = list_case
+        fm, _ = parse_frontmatter(f"---\n{key}:\n{items}---\n")
+        assert fm[key] == expected
 
     def test_key_with_null_and_no_list_stays_none(self) -> None:
         text = "---\nsources:\nname: Test\n---\n"
@@ -94,6 +115,13 @@ class TestListValues:
 
 
 class TestEdgeCases:
+    @pytest.mark.parametrize("size", [1024, 65536, 1 << 20])
+    def test_large_body_preserved(self, size: int) -> None:
+        body_text = "x" * size
+        fm, body = parse_frontmatter("---\nk: v\n---\n" + body_text)
+        assert fm == {"k": "v"}
+        assert body == body_text
+
     def test_blank_lines_in_frontmatter_ignored(self) -> None:
         text = "---\nname: Test\n\ndescription: Desc\n---\n"
         fm, _ = parse_frontmatter(text)
@@ -4,29 +4,32 @@ from __future__ import annotations
 
 import json
 import sys
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 
 def _run_audit(*args: str, issues: list[dict] | None = None) -> tuple[str, str, int]:
     """Run lint.main() with given CLI args, returning (stdout, stderr, exitcode)."""
+    from scripts.lint import main
+
     captured_stdout = StringIO()
     captured_stderr = StringIO()
     exit_code = 0
 
-    mock_target = "wiki.project.validate_project"
+    mock_validate = (
+        patch("wiki.project.validate_project", return_value=issues)
+        if issues is not None
+        else nullcontext()
+    )
 
-    with patch.object(sys, "argv", ["lint.py", *args]):
-        with patch("sys.stdout", captured_stdout), patch("sys.stderr", captured_stderr):
+    with patch.object(sys, "argv", ["lint.py", *args]), mock_validate:
+        with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
             try:
-                if issues is not None:
-                    with patch(mock_target, return_value=issues):
-                        from scripts.lint import main
-                        main()
-                else:
-                    from scripts.lint import main
-                    main()
+                main()
             except SystemExit as exc:
                 exit_code = exc.code if exc.code is not None else 0
 
@@ -80,40 +83,30 @@ class TestTableFormat:
 
 
 class TestExitCodes:
-    def test_exit_1_on_fail_issues(self, tmp_path: Path) -> None:
-        root = tmp_path / "project"
-        root.mkdir()
-        issues = [
-            {"file": str(root / "a.md"), "issue": "Problem", "severity": "fail"},
-        ]
-        _, _, code = _run_audit("--root", str(root), issues=issues)
-        assert code == 1
-
-    def test_exit_0_on_warn_only(self, tmp_path: Path) -> None:
-        root = tmp_path / "project"
-        root.mkdir()
-        issues = [
-            {"file": str(root / "a.md"), "issue": "Drift", "severity": "warn"},
-        ]
-        _, _, code = _run_audit("--root", str(root), issues=issues)
-        assert code == 0
-
-    def test_exit_1_on_warn_with_strict(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        "severities,flags,expected",
+        [
+            pytest.param(["fail"], [], 1, id="fail"),
+            pytest.param(["warn"], [], 0, id="warn"),
+            pytest.param(["warn"], ["--strict"], 1, id="warn-strict"),
+            pytest.param([], [], 0, id="clean"),
+        ],
+    )
+    def test_exit_code(
+        self,
+        tmp_path: Path,
+        severities: list[str],
+        flags: list[str],
+        expected: int,
+    ) -> None:
         root = tmp_path / "project"
         root.mkdir()
         issues = [
-            {"file": str(root / "a.md"), "issue": "Drift", "severity": "warn"},
+            {"file": str(root / "a.md"), "issue": "Problem", "severity": sev}
+            for sev in severities
         ]
-        _, _, code = _run_audit(
-            "--root", str(root), "--strict", issues=issues,
-        )
-        assert code == 1
-
-    def test_exit_0_on_no_issues(self, tmp_path: Path) -> None:
-        root = tmp_path / "project"
-        root.mkdir()
-        _, _, code = _run_audit("--root", str(root), issues=[])
-        assert code == 0
+        _, _, code = _run_audit("--root", str(root), *flags, issues=issues)
+        assert code == expected
 
 
 class TestJsonOutput:
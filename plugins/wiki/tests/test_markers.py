@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import re
+
+from wiki.agents_md import replace_marker_section
+
+# Every fragment the replace test looks for, matched in a single scan.
+_MARK_RE = re.compile(r"new stuff|old stuff|Before\.|After\.")
+
 
 class TestReplaceMarkerSection:
     def test_replaces_between_existing_markers(self) -> None:
-        from wiki.agents_md import replace_marker_section
-
         content = (
             "Before.\n\n"
             "<!-- begin -->\nold stuff\n<!-- end -->\n\n"
@@ -15,14 +20,10 @@ class TestReplaceMarkerSection:
         result = replace_marker_section(
             content, "<!-- begin -->", "<!-- end -->", "new stuff\n"
         )
-        assert "old stuff" not in result
-        assert "new stuff" in result
-        assert "Before." in result
-        assert "After." in result
+        found = set(_MARK_RE.findall(result))
+        assert found == {"new stuff", "Before.", "After."}
 
     def test_appends_when_no_markers(self) -> None:
-        from wiki.agents_md import replace_marker_section
-
         content = "# Header\n\nExisting content.\n"
         result = replace_marker_section(
             content, "<!-- begin -->", "<!-- end -->", "new section\n"
@@ -32,8 +33,6 @@ class TestReplaceMarkerSection:
         assert "new section" in result
 
     def test_consumes_trailing_newline_after_end_marker(self) -> None:
-        from wiki.agents_md import replace_marker_section
-
         content = "Before.\n<!-- begin -->\nold\n<!-- end -->\nAfter.\n"
         result = replace_marker_section(
             content, "<!-- begin -->", "<!-- end -->", "new\n"
@@ -42,8 +41,6 @@ class TestReplaceMarkerSection:
         assert "new\nAfter." in result
 
     def test_handles_empty_content(self) -> None:
-        from wiki.agents_md import replace_marker_section
-
         result = replace_marker_section(
             "", "<!-- begin -->", "<!-- end -->", "section\n"
         )
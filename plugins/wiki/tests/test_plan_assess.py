@@ -8,22 +8,37 @@ class TestAssessFile:
 
     def _write_plan(self, path, status="approved", tasks_content=""):
         """Helper to create a plan file."""
-        content = (
-            "---\n"
-            "name: Test Plan\n"
-            "description: A test plan\n"
-            "type: plan\n"
-            f"status: {status}\n"
-            "---\n"
-            "\n"
-            "## Goal\n\nBuild the thing.\n\n"
-            "## Scope\n\nMust/Won't.\n\n"
-            "## Approach\n\nHow.\n\n"
-            "## File Changes\n\n- Create: foo.py\n\n"
-            f"## Tasks\n{tasks_content}\n\n"
-            "## Validation\n\n- [ ] pytest passes\n"
-        )
-        path.write_text(content)
+        path.write_text(f"""\
+---
+name: Test Plan
+description: A test plan
+type: plan
+status: {status}
+---
+
+## Goal
+
+Build the thing.
+
+## Scope
+
+Must/Won't.
+
+## Approach
+
+How.
+
+## File Changes
+
+- Create: foo.py
+
+## Tasks
+{tasks_content}
+
+## Validation
+
+- [ ] pytest passes
+""")
 
     def test_approved_plan_ready(self, tmp_path) -> None:
         """Approved plan with all sections reports ready."""
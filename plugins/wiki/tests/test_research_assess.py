@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import pytest
+from wiki.research import _GATE_ORDER
+
+# Every gate check_gates() reports on, for whole-result pass/fail checks.
+_ALL_GATES = frozenset(_GATE_ORDER)
+
 # --- Fixtures for gate check tests -----------------------------------------
 
 # Complete research doc that passes all gates.
@@ -328,19 +334,17 @@ class TestScanDirectory:
         )
         sources_block = f"sources:\n{sources}" if sources_count > 0 else ""
         draft_marker = "<!-- DRAFT -->\n" if draft else ""
-        words = " ".join(["word"] * word_count_target)
-        path.write_text(
-            f"---\n"
-            f"name: {name}\n"
-            f"description: Research about {name}\n"
-            f"type: research\n"
-            f"{sources_block}"
-            f"---\n"
-            f"{draft_marker}"
-            f"# {name}\n"
-            f"\n"
-            f"{words}\n"
-        )
+        words = ("word " * word_count_target).rstrip()
+        path.write_text(f"""\
+---
+name: {name}
+description: Research about {name}
+type: research
+{sources_block}---
+{draft_marker}# {name}
+
+{words}
+""")
 
     def test_scan_finds_research_docs(self, tmp_path) -> None:
         """Scan returns all type:research docs in the directory."""
@@ -456,53 +460,63 @@ class TestScanDirectory:
         assert "file" in doc
 
 
+@pytest.fixture(scope="module")
+def gate_docs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Write the read-only gate fixture docs once; map short name to path."""
+    base = tmp_path_factory.mktemp("gate_docs")
+    docs = {
+        "complete": _COMPLETE_DOC,
+        "gathered": _GATHERER_EXIT_DOC,
+        "evaluated": _EVALUATOR_EXIT_DOC,
+        "unverified": _UNVERIFIED_CLAIMS_DOC,
+    }
+    paths: dict[str, str] = {}
+    for name, text in docs.items():
+        path = base / f"{name}.md"
+        path.write_text(text)
+        paths[name] = str(path)
+    return paths
+
+
 class TestCheckGates:
     """Tests for check_gates() — deterministic phase gate validation."""
 
-    def test_complete_doc_passes_all_gates(self, tmp_path) -> None:
+    def test_complete_doc_passes_all_gates(self, gate_docs) -> None:
         """A fully completed research doc passes all 6 gates."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "complete.md"
-        doc.write_text(_COMPLETE_DOC)
-        result = ResearchDocument.check_gates(str(doc))
+        result = ResearchDocument.check_gates(gate_docs["complete"])
 
         assert result["current_phase"] == "done"
-        for gate_name, gate in result["gates"].items():
-            assert gate["pass"] is True, f"{gate_name} should pass"
+        passing = {name for name, gate in result["gates"].items() if gate["pass"]}
+        assert passing == _ALL_GATES
 
-    def test_gatherer_exit_passes_at_gatherer_stage(self, tmp_path) -> None:
+    def test_gatherer_exit_passes_at_gatherer_stage(self, gate_docs) -> None:
         """Doc at gatherer exit passes gatherer gate, fails evaluator."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "gathered.md"
-        doc.write_text(_GATHERER_EXIT_DOC)
-        result = ResearchDocument.check_gates(str(doc))
+        result = ResearchDocument.check_gates(gate_docs["gathered"])
 
         assert result["gates"]["gatherer_exit"]["pass"] is True
         assert result["gates"]["evaluator_exit"]["pass"] is False
         assert result["current_phase"] == "evaluator"
 
-    def test_evaluator_exit_passes_at_evaluator_stage(self, tmp_path) -> None:
+    def test_evaluator_exit_passes_at_evaluator_stage(self, gate_docs) -> None:
         """Doc at evaluator exit passes evaluator gate, fails challenger."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "evaluated.md"
-        doc.write_text(_EVALUATOR_EXIT_DOC)
-        result = ResearchDocument.check_gates(str(doc))
+        result = ResearchDocument.check_gates(gate_docs["evaluated"])
 
         assert result["gates"]["gatherer_exit"]["pass"] is True
         assert result["gates"]["evaluator_exit"]["pass"] is True
         assert result["gates"]["challenger_exit"]["pass"] is False
         assert result["current_phase"] == "challenger"
 
-    def test_unverified_claims_fail_verifier_gate(self, tmp_path) -> None:
+    def test_unverified_claims_fail_verifier_gate(self, gate_docs) -> None:
         """Doc with unverified claims fails verifier exit gate."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "unverified.md"
-        doc.write_text(_UNVERIFIED_CLAIMS_DOC)
-        result = ResearchDocument.check_gates(str(doc))
+        result = ResearchDocument.check_gates(gate_docs["unverified"])
 
         verifier = result["gates"]["verifier_exit"]
         assert verifier["pass"] is False
@@ -516,8 +530,8 @@ class TestCheckGates:
         result = ResearchDocument.check_gates("/nonexistent/doc.md")
 
         assert result["current_phase"] == "gatherer"
-        for gate_name, gate in result["gates"].items():
-            assert gate["pass"] is False, f"{gate_name} should fail"
+        failing = {name for name, gate in result["gates"].items() if not gate["pass"]}
+        assert failing == _ALL_GATES
 
     def test_current_phase_stops_at_first_failure(self, tmp_path) -> None:
         """current_phase reflects the phase after the highest passing gate."""
@@ -579,37 +593,33 @@ class TestCheckGates:
 class TestCheckSingleGate:
     """Tests for check_single_gate() — individual gate queries."""
 
-    def test_single_gate_returns_specific_result(self, tmp_path) -> None:
+    def test_single_gate_returns_specific_result(self, gate_docs) -> None:
         """check_single_gate returns just the requested gate."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "complete.md"
-        doc.write_text(_COMPLETE_DOC)
-        result = ResearchDocument.check_single_gate(str(doc), "evaluator_exit")
+        result = ResearchDocument.check_single_gate(
+            gate_docs["complete"], "evaluator_exit"
+        )
 
         assert result["gate"] == "evaluator_exit"
         assert result["pass"] is True
         assert "checks" in result
         assert "current_phase" in result
 
-    def test_single_gate_all_returns_full_result(self, tmp_path) -> None:
+    def test_single_gate_all_returns_full_result(self, gate_docs) -> None:
         """check_single_gate with 'all' returns the full gates dict."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "complete.md"
-        doc.write_text(_COMPLETE_DOC)
-        result = ResearchDocument.check_single_gate(str(doc), "all")
+        result = ResearchDocument.check_single_gate(gate_docs["complete"], "all")
 
         assert "gates" in result
         assert len(result["gates"]) == 6
 
-    def test_unknown_gate_returns_error(self, tmp_path) -> None:
+    def test_unknown_gate_returns_error(self, gate_docs) -> None:
         """Unknown gate name returns an error dict."""
         from wiki.research import ResearchDocument
 
-        doc = tmp_path / "complete.md"
-        doc.write_text(_COMPLETE_DOC)
-        result = ResearchDocument.check_single_gate(str(doc), "bogus_gate")
+        result = ResearchDocument.check_single_gate(gate_docs["complete"], "bogus_gate")
 
         assert "error" in result
         assert "valid_gates" in result
@@ -10,6 +10,7 @@ to find plugins/wiki/, which is where the wiki editable install lives.
 """
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -18,34 +19,50 @@ from pathlib import Path
 SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
 
 
-class TestLintSysPath:
-    def test_lint_runs_from_different_cwd(self, tmp_path: Path) -> None:
-        """lint.py should work when CWD is not the plugin root."""
+# Loads every script once in a single interpreter. The scripts dir goes on
+# sys.path the same way `python scripts/<name>.py` would put it there. Any
+# existing entry for plugins/wiki/src (e.g. from an editable install's .pth)
+# is dropped first, so the final assert only passes if _bootstrap put it back.
+_IMPORT_CHECK = """\
+import os, runpy, sys
+scripts_dir = sys.argv[1]
+src = os.path.join(os.path.dirname(scripts_dir), "src")
+sys.path[:] = [p for p in sys.path if os.path.abspath(p) != src]
+sys.path.insert(0, scripts_dir)
+for name in ("lint.py", "check_url.py"):
+    runpy.run_path(f"{scripts_dir}/{name}", run_name="__import_check__")
+import _bootstrap
+assert str(_bootstrap.plugin_root / "src") in sys.path, sys.path
+print("ok")
+"""
+
+
+class TestScriptImportsSysPath:
+    def test_scripts_import_from_different_cwd(self, tmp_path: Path) -> None:
+        """All scripts resolve their imports when CWD is not the plugin root."""
         result = subprocess.run(
-            [
-                sys.executable, str(SCRIPTS_DIR / "lint.py"),
-                "--root", str(tmp_path),
-            ],
+            [sys.executable, "-c", _IMPORT_CHECK, str(SCRIPTS_DIR)],
             capture_output=True,
-            text=True,
             cwd=str(tmp_path),
+            env={k: v for k, v in os.environ.items() if k != "CLAUDE_PLUGIN_ROOT"},
         )
-        # No ModuleNotFoundError — script should either pass (no content dirs)
-        # or fail gracefully (no docs/ dir)
-        assert "ModuleNotFoundError" not in result.stderr
-        assert "No module named" not in result.stderr
+        assert b"ModuleNotFoundError" not in result.stderr
+        assert b"No module named" not in result.stderr
+        assert result.returncode == 0
+        assert result.stdout.strip() == b"ok"
+
 
+class TestLintSysPath:
     def test_lint_help_from_different_cwd(self, tmp_path: Path) -> None:
         """lint.py --help should work from any directory."""
         result = subprocess.run(
             [sys.executable, str(SCRIPTS_DIR / "lint.py"), "--help"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             cwd=str(tmp_path),
         )
         assert result.returncode == 0
-        assert "validation checks" in result.stdout.lower()
-
+        assert b"validation checks" in result.stdout.lower()
 
 
 class TestLintSingleFileSysPath:
@@ -58,10 +75,10 @@ class TestLintSingleFileSysPath:
                 sys.executable, str(SCRIPTS_DIR / "lint.py"),
                 str(doc), "--root", str(tmp_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=str(tmp_path),
         )
-        assert "ModuleNotFoundError" not in result.stderr
-        assert "No module named" not in result.stderr
+        assert b"ModuleNotFoundError" not in result.stderr
+        assert b"No module named" not in result.stderr
         assert result.returncode == 0
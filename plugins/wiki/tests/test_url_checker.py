@@ -5,11 +5,22 @@ All HTTP calls are mocked. No network traffic in tests.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock
 from urllib.error import HTTPError, URLError
 
+import pytest
 from wiki.url_checker import UrlCheckResult, check_url, check_urls
 
+
+@pytest.fixture(autouse=True)
+def mock_urlopen(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace urlopen for every test so nothing reaches the network."""
+    mock = MagicMock()
+    monkeypatch.setattr("wiki.url_checker.urlopen", mock)
+    return mock
+
+
 # ── UrlCheckResult dataclass ─────────────────────────────────────
 
 
@@ -39,19 +50,24 @@ def test_url_check_result_unreachable_with_reason() -> None:
 # ── check_url ────────────────────────────────────────────────────
 
 
-def _mock_response(status: int = 200) -> MagicMock:
-    """Create a mock urllib response with the given status."""
-    resp = MagicMock()
-    resp.status = status
-    resp.__enter__ = MagicMock(return_value=resp)
-    resp.__exit__ = MagicMock(return_value=False)
-    return resp
+class _FakeResponse:
+    """Minimal urlopen response: a status and context-manager support."""
+
+    __slots__ = ("status",)
+
+    def __init__(self, status: int = 200) -> None:
+        self.status = status
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
 
 
-@patch("wiki.url_checker.urlopen")
 def test_check_url_200_reachable(mock_urlopen: MagicMock) -> None:
     """HTTP 200 response marks URL as reachable."""
-    mock_urlopen.return_value = _mock_response(200)
+    mock_urlopen.return_value = _FakeResponse(200)
     result = check_url("https://example.com/page")
     assert result.reachable is True
     assert result.status == 200
@@ -59,25 +75,26 @@ def test_check_url_200_reachable(mock_urlopen: MagicMock) -> None:
     mock_urlopen.assert_called_once()
 
 
-@patch("wiki.url_checker.urlopen")
-def test_check_url_404_unreachable(mock_urlopen: MagicMock) -> None:
-    """HTTP 404 response marks URL as unreachable."""
+@pytest.mark.parametrize("code,msg", [(404, "Not Found"), (500, "Server Error")])
+def test_check_url_http_error_unreachable(
+    mock_urlopen: MagicMock, code: int, msg: str
+) -> None:
+    """4xx/5xx HTTP errors mark URL as unreachable with that status."""
     mock_urlopen.side_effect = HTTPError(
-        "https://example.com/missing", 404, "Not Found", {}, None
+        "https://example.com/missing", code, msg, {}, None
     )
     result = check_url("https://example.com/missing")
     assert result.reachable is False
-    assert result.status == 404
-    assert result.reason is not None
+    assert result.status == code
+    assert result.reason == f"HTTP {code}"
 
 
-@patch("wiki.url_checker.urlopen")
 def test_check_url_head_405_falls_back_to_get(mock_urlopen: MagicMock) -> None:
     """HEAD returning 405 triggers a GET fallback."""
     # First call (HEAD) raises 405, second call (GET) succeeds
     mock_urlopen.side_effect = [
         HTTPError("https://example.com/no-head", 405, "Method Not Allowed", {}, None),
-        _mock_response(200),
+        _FakeResponse(200),
     ]
     result = check_url("https://example.com/no-head")
     assert result.reachable is True
@@ -85,25 +102,25 @@ def test_check_url_head_405_falls_back_to_get(mock_urlopen: MagicMock) -> None:
     assert mock_urlopen.call_count == 2
 
 
-@patch("wiki.url_checker.urlopen")
-def test_check_url_connection_error(mock_urlopen: MagicMock) -> None:
-    """Connection error returns status=0, reachable=False."""
-    mock_urlopen.side_effect = URLError("DNS resolution failed")
-    result = check_url("https://nonexistent.example.com")
-    assert result.reachable is False
-    assert result.status == 0
-    assert result.reason is not None
-    assert "DNS resolution failed" in result.reason
-
-
-@patch("wiki.url_checker.urlopen")
-def test_check_url_timeout(mock_urlopen: MagicMock) -> None:
-    """Timeout returns status=0, reachable=False."""
-    mock_urlopen.side_effect = URLError("timed out")
-    result = check_url("https://slow.example.com")
+@pytest.mark.parametrize(
+    "url,reason",
+    [
+        pytest.param(
+            "https://nonexistent.example.com", "DNS resolution failed", id="dns"
+        ),
+        pytest.param("https://slow.example.com", "timed out", id="timeout"),
+    ],
+)
+def test_check_url_connection_error(
+    mock_urlopen: MagicMock, url: str, reason: str
+) -> None:
+    """Connection errors and timeouts return status=0, reachable=False."""
+    mock_urlopen.side_effect = URLError(reason)
+    result = check_url(url)
     assert result.reachable is False
     assert result.status == 0
     assert result.reason is not None
+    assert reason in result.reason
 
 
 def test_check_url_invalid_scheme() -> None:
@@ -118,13 +135,12 @@ def test_check_url_invalid_scheme() -> None:
 # ── check_urls (batch) ───────────────────────────────────────────
 
 
-@patch("wiki.url_checker.urlopen")
 def test_check_urls_batch(mock_urlopen: MagicMock) -> None:
     """Batch check returns a result for each unique URL."""
     def side_effect(req, **kwargs):
         url = req.full_url if hasattr(req, 'full_url') else str(req)
         if "good" in url:
-            return _mock_response(200)
+            return _FakeResponse(200)
         raise HTTPError(url, 404, "Not Found", {}, None)
 
     mock_urlopen.side_effect = side_effect
@@ -138,16 +154,16 @@ def test_check_urls_batch(mock_urlopen: MagicMock) -> None:
     assert results[1].reachable is False
 
 
-def test_check_urls_empty_list() -> None:
+def test_check_urls_empty_list(mock_urlopen: MagicMock) -> None:
     """Empty input returns empty output without any HTTP calls."""
     results = check_urls([])
     assert results == []
+    mock_urlopen.assert_not_called()
 
 
-@patch("wiki.url_checker.urlopen")
 def test_check_urls_deduplicates(mock_urlopen: MagicMock) -> None:
     """Duplicate URLs are checked only once."""
-    mock_urlopen.return_value = _mock_response(200)
+    mock_urlopen.return_value = _FakeResponse(200)
     results = check_urls([
         "https://example.com/page",
         "https://example.com/page",
@@ -156,3 +172,32 @@ def test_check_urls_deduplicates(mock_urlopen: MagicMock) -> None:
     assert len(results) == 1
     assert results[0].url == "https://example.com/page"
     mock_urlopen.assert_called_once()
+
+
+def test_check_urls_preserves_first_seen_order(mock_urlopen: MagicMock) -> None:
+    """Results follow first-seen input order even when checked concurrently."""
+    mock_urlopen.return_value = _FakeResponse(200)
+    urls = [f"https://example.com/{n}" for n in ("c", "a", "c", "b", "a", "d")]
+    results = check_urls(urls)
+    assert [r.url for r in results] == [
+        "https://example.com/c",
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/d",
+    ]
+    assert mock_urlopen.call_count == 4
+
+
+def test_check_urls_checks_concurrently(mock_urlopen: MagicMock) -> None:
+    """Unique URLs are in flight at the same time, not checked one by one."""
+    # Each fake request waits for the other; a serial loop would time out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def side_effect(req, **kwargs):
+        barrier.wait()
+        return _FakeResponse(200)
+
+    mock_urlopen.side_effect = side_effect
+    results = check_urls(["https://example.com/a", "https://example.com/b"])
+    assert [r.reachable for r in results] == [True, True]
+    assert mock_urlopen.call_count == 2
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
+import pytest
+
 # ── Helpers ─────────────────────────────────────────────────────
 
 
@@ -52,6 +55,16 @@ class TestCheckProjectFiles:
         agents_issues = [i for i in issues if i["file"] == "AGENTS.md"]
         assert agents_issues == []
 
+    def test_agents_md_with_non_utf8_bytes_still_checked(self, tmp_path: Path) -> None:
+        from wiki.project import check_project_files
+
+        (tmp_path / "AGENTS.md").write_bytes(
+            b"# Agents \xff\n\n<!-- wiki:begin -->\nmanaged\n<!-- wiki:end -->\n"
+        )
+        issues = check_project_files(tmp_path)
+        agents_issues = [i for i in issues if i["file"] == "AGENTS.md"]
+        assert agents_issues == []
+
     def test_no_claude_md_warns(self, tmp_path: Path) -> None:
         from wiki.project import check_project_files
 
@@ -101,13 +114,27 @@ def _seed_conventionful_dirs(root: Path, dirs: list[str]) -> None:
         (d / f"b{suffix}").write_text(_md("B"))
 
 
+@pytest.fixture(scope="module")
+def _seeded_three_dirs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Seed .context/.plans/.designs once; tests get copies via three_dirs."""
+    base = tmp_path_factory.mktemp("three_dirs")
+    _seed_conventionful_dirs(base, [".context", ".plans", ".designs"])
+    return base
+
+
+@pytest.fixture
+def three_dirs(tmp_path: Path, _seeded_three_dirs: Path) -> Path:
+    """tmp_path holding a private copy of the three seeded conventionful dirs."""
+    shutil.copytree(_seeded_three_dirs, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
 class TestCheckResolverRecommendation:
-    def test_no_recommendation_when_resolver_present(self, tmp_path: Path) -> None:
+    def test_no_recommendation_when_resolver_present(self, three_dirs: Path) -> None:
         from wiki.project import check_resolver_recommendation
 
-        (tmp_path / "RESOLVER.md").write_text("# RESOLVER.md\n")
-        _seed_conventionful_dirs(tmp_path, [".context", ".plans", ".designs"])
-        assert check_resolver_recommendation(tmp_path) == []
+        (three_dirs / "RESOLVER.md").write_text("# RESOLVER.md\n")
+        assert check_resolver_recommendation(three_dirs) == []
 
     def test_no_recommendation_below_threshold(self, tmp_path: Path) -> None:
         from wiki.project import check_resolver_recommendation
@@ -115,11 +142,10 @@ class TestCheckResolverRecommendation:
         _seed_conventionful_dirs(tmp_path, [".context", ".plans"])
         assert check_resolver_recommendation(tmp_path) == []
 
-    def test_warns_at_threshold(self, tmp_path: Path) -> None:
+    def test_warns_at_threshold(self, three_dirs: Path) -> None:
         from wiki.project import check_resolver_recommendation
 
-        _seed_conventionful_dirs(tmp_path, [".context", ".plans", ".designs"])
-        issues = check_resolver_recommendation(tmp_path)
+        issues = check_resolver_recommendation(three_dirs)
         assert len(issues) == 1
         assert issues[0]["severity"] == "warn"
         assert issues[0]["file"] == "RESOLVER.md"
@@ -171,12 +197,11 @@ class TestCheckResolverRecommendation:
         assert len(issues) == 1
         assert issues[0]["severity"] == "warn"
 
-    def test_threshold_override_raises_trigger(self, tmp_path: Path) -> None:
+    def test_threshold_override_raises_trigger(self, three_dirs: Path) -> None:
         from wiki.project import check_resolver_recommendation
 
         # Three conventionful dirs warns by default; threshold=5 should silence it.
-        _seed_conventionful_dirs(tmp_path, [".context", ".plans", ".designs"])
-        assert check_resolver_recommendation(tmp_path, threshold=5) == []
+        assert check_resolver_recommendation(three_dirs, threshold=5) == []
 
     def test_ignores_ambient_dirs(self, tmp_path: Path) -> None:
         from wiki.project import check_resolver_recommendation
@@ -188,11 +213,31 @@ class TestCheckResolverRecommendation:
             (d / "b.context.md").write_text(_md("B"))
         assert check_resolver_recommendation(tmp_path) == []
 
-    def test_check_project_files_includes_recommendation(self, tmp_path: Path) -> None:
+    def test_ignores_nested_ambient_dirs(self, tmp_path: Path) -> None:
+        from wiki.project import check_resolver_recommendation
+
+        # Frontmatter files only under a nested node_modules → none qualify
+        for name in ("notes", "drafts", "ideas"):
+            d = tmp_path / name / "node_modules"
+            d.mkdir(parents=True)
+            (d / "a.md").write_text(_md("A"))
+            (d / "b.md").write_text(_md("B"))
+        assert check_resolver_recommendation(tmp_path) == []
+
+    def test_root_inside_ambient_named_dir_still_counts(self, tmp_path: Path) -> None:
+        from wiki.project import check_resolver_recommendation
+
+        # Ambient names above the project root must not hide its directories
+        root = tmp_path / "build" / "project"
+        _seed_conventionful_dirs(root, [".context", ".plans", ".designs"])
+        assert len(check_resolver_recommendation(root)) == 1
+
+    def test_check_project_files_includes_recommendation(
+        self, three_dirs: Path
+    ) -> None:
         from wiki.project import check_project_files
 
-        _seed_conventionful_dirs(tmp_path, [".context", ".plans", ".designs"])
-        issues = check_project_files(tmp_path)
+        issues = check_project_files(three_dirs)
         resolver_issues = [i for i in issues if i["file"] == "RESOLVER.md"]
         assert len(resolver_issues) == 1
 
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
+_VERSION_RE = re.compile(r'^\s*version\s*=\s*"([^"]*)"', re.MULTILINE)
+
 
 def _plugin_root() -> Path:
     """Return the wiki plugin root (plugins/wiki/)."""
@@ -17,17 +20,13 @@ def test_version_consistent_across_config_files() -> None:
 
     # pyproject.toml
     pyproject_text = (root / "pyproject.toml").read_text(encoding="utf-8")
-    pyproject_version = None
-    for line in pyproject_text.splitlines():
-        if line.strip().startswith("version"):
-            pyproject_version = line.split("=", 1)[1].strip().strip('"')
-            break
-    assert pyproject_version is not None, "No version found in pyproject.toml"
+    match = _VERSION_RE.search(pyproject_text)
+    assert match is not None, "No version found in pyproject.toml"
+    pyproject_version = match.group(1)
 
     # plugin.json
-    plugin_data = json.loads(
-        (root / ".claude-plugin" / "plugin.json").read_text(encoding="utf-8")
-    )
+    with (root / ".claude-plugin" / "plugin.json").open(encoding="utf-8") as f:
+        plugin_data = json.load(f)
     plugin_version = plugin_data["version"]
 
     assert pyproject_version == plugin_version, (
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pytest  # noqa: F401
+import pytest
 
 # ── Helpers ──────────────────────────────────────────────────────
 
@@ -37,6 +37,13 @@ def _schema_md(
     return "\n".join(lines)
 
 
+# Section keys parse_schema returns; unknown SCHEMA.md sections are dropped.
+_SCHEMA_KEYS = frozenset({"page_types", "confidence_tiers", "relationship_types"})
+
+# Default SCHEMA.md text, rendered once; most tests write it unchanged.
+_DEFAULT_SCHEMA_MD = _schema_md()
+
+
 def _wiki_doc(
     tmp_path: Path,
     name: str = "Test Page",
@@ -92,7 +99,7 @@ class TestParseSchemaValid:
         from wiki.wiki import parse_schema
 
         schema_file = tmp_path / "SCHEMA.md"
-        schema_file.write_text(_schema_md(), encoding="utf-8")
+        schema_file.write_text(_DEFAULT_SCHEMA_MD, encoding="utf-8")
 
         schema = parse_schema(schema_file)
 
@@ -103,15 +110,13 @@ class TestParseSchemaValid:
     def test_extra_sections_ignored(self, tmp_path: Path) -> None:
         from wiki.wiki import parse_schema
 
-        content = _schema_md() + "\n## Lint Rules\n- staleness: 90 days\n"
+        content = _DEFAULT_SCHEMA_MD + "\n## Lint Rules\n- staleness: 90 days\n"
         schema_file = tmp_path / "SCHEMA.md"
         schema_file.write_text(content, encoding="utf-8")
 
         schema = parse_schema(schema_file)
 
-        assert set(schema.keys()) == {
-            "page_types", "confidence_tiers", "relationship_types"
-        }
+        assert schema.keys() == _SCHEMA_KEYS
 
 
 # ── TestParseSchemaMissingSection ─────────────────────────────────
@@ -306,7 +311,7 @@ class TestValidateWikiClean:
 
         # Write SCHEMA.md
         schema_path = tmp_path / "SCHEMA.md"
-        schema_path.write_text(_schema_md(), encoding="utf-8")
+        schema_path.write_text(_DEFAULT_SCHEMA_MD, encoding="utf-8")
 
         # Write a valid wiki page
         page_path = tmp_path / "my-concept.md"
@@ -339,7 +344,7 @@ class TestValidateWikiWithViolations:
         from wiki.wiki import validate_wiki
 
         schema_path = tmp_path / "SCHEMA.md"
-        schema_path.write_text(_schema_md(), encoding="utf-8")
+        schema_path.write_text(_DEFAULT_SCHEMA_MD, encoding="utf-8")
 
         page_path = tmp_path / "bad-page.md"
         page_content = (
@@ -388,21 +393,30 @@ def _valid_page_content(name: str = "Page", doc_type: str = "concept") -> str:
 
 
 class TestValidateWikiRecursive:
-    def test_page_in_subdir_is_validated(self, tmp_path: Path) -> None:
-        """validate_wiki() walks subdirectories and validates their pages."""
-        from wiki.wiki import validate_wiki
+    def _write_subdir_wiki(self, root: Path, page_name: str, content: str) -> Path:
+        """Write SCHEMA.md, a patterns/ subdir with one page, and both _index.md files.
 
-        schema_path = tmp_path / "SCHEMA.md"
-        schema_path.write_text(_schema_md(), encoding="utf-8")
+        Returns the SCHEMA.md path.
+        """
+        schema_path = root / "SCHEMA.md"
+        schema_path.write_text(_DEFAULT_SCHEMA_MD, encoding="utf-8")
 
-        subdir = tmp_path / "patterns"
+        subdir = root / "patterns"
         subdir.mkdir()
-        page = subdir / "caching.md"
-        page.write_text(_valid_page_content("Caching"), encoding="utf-8")
+        (subdir / page_name).write_text(content, encoding="utf-8")
         (subdir / "_index.md").write_text(
-            "| [caching.md](caching.md) | A page |\n", encoding="utf-8"
+            f"| [{page_name}]({page_name}) | A page |\n", encoding="utf-8"
+        )
+        (root / "_index.md").write_text("# wiki\n", encoding="utf-8")
+        return schema_path
+
+    def test_page_in_subdir_is_validated(self, tmp_path: Path) -> None:
+        """validate_wiki() walks subdirectories and validates their pages."""
+        from wiki.wiki import validate_wiki
+
+        schema_path = self._write_subdir_wiki(
+            tmp_path, "caching.md", _valid_page_content("Caching")
         )
-        (tmp_path / "_index.md").write_text("# wiki\n", encoding="utf-8")
 
         issues = validate_wiki(tmp_path, schema_path)
 
@@ -413,19 +427,9 @@ class TestValidateWikiRecursive:
         """A type violation in a subdirectory page is reported as fail."""
         from wiki.wiki import validate_wiki
 
-        schema_path = tmp_path / "SCHEMA.md"
-        schema_path.write_text(_schema_md(), encoding="utf-8")
-
-        subdir = tmp_path / "patterns"
-        subdir.mkdir()
-        page = subdir / "bad.md"
-        page.write_text(
-            _valid_page_content("Bad", doc_type="unknown-type"), encoding="utf-8"
+        schema_path = self._write_subdir_wiki(
+            tmp_path, "bad.md", _valid_page_content("Bad", doc_type="unknown-type")
         )
-        (subdir / "_index.md").write_text(
-            "| [bad.md](bad.md) | A page |\n", encoding="utf-8"
-        )
-        (tmp_path / "_index.md").write_text("# wiki\n", encoding="utf-8")
 
         issues = validate_wiki(tmp_path, schema_path)
 
@@ -437,7 +441,7 @@ class TestValidateWikiRecursive:
         from wiki.wiki import validate_wiki
 
         schema_path = tmp_path / "SCHEMA.md"
-        schema_path.write_text(_schema_md(), encoding="utf-8")
+        schema_path.write_text(_DEFAULT_SCHEMA_MD, encoding="utf-8")
         (tmp_path / "_index.md").write_text("# wiki\n", encoding="utf-8")
         (tmp_path / "log.md").write_text(
             "## [2026-01-01] ingest | Source\n1 page created.\n",